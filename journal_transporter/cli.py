@@ -591,6 +591,8 @@ async def transfer(
         if not resume: database.prepare(keep)
         transfer_methods = ["fetch_indexes", "fetch_data", "push_data"]
 
+    progress_reporter = None
+    handler = None
     try:
         progress_reporter = CliProgressReporter(typer,
                                                 init_message="Initializing...",
@@ -611,8 +613,10 @@ async def transfer(
             method(journals)
     except AbortError:
         write("Operation aborted by user", line_break=True, theme="attention")
-
-    progress_reporter.clean_up()
+    finally:
+        # Always release connections, even if the transfer is aborted or fails
+        if handler is not None: handler.finalize()
+        if progress_reporter is not None: progress_reporter.clean_up()
 
 
 # Callbacks
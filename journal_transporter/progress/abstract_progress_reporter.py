@@ -30,9 +30,11 @@ There is also the DEBUG type, which does not display progress bars, but instead
 
 from abc import ABC, abstractmethod
 from typing import Any
-from datetime import datetime
-from pprint import PrettyPrinter
+from pprint import pformat
+import multiprocessing
 import textwrap
+import threading
+import time
 
 from journal_transporter.progress.progress_update_type import ProgressUpdateType
 from journal_transporter.transfer.exceptions import ServerResponseError
@@ -40,6 +42,10 @@ from journal_transporter.transfer.exceptions import ServerResponseError
 
 class AbstractProgressReporter(ABC):
 
+    # If True, non-forced renders are coalesced and drawn on a background thread, so the caller never
+    # blocks on interface writes. Else, they are drawn synchronously (but still throttled).
+    background_render = True
+
     def __init__(self, interface: Any, init_message: str = None, start: int = 0, verbose: bool = False,
                  debug: bool = False, log: str = "n", on_error: str = "i", **args) -> None:
         """
@@ -68,12 +74,47 @@ class AbstractProgressReporter(ABC):
         self.log_debug = log in ["d", "debug"]
         self.log_error = log in ["e", "error"]
         self.log_file = None
+        self._log_fp = None
+        self._ts_cache = (0, "")
         self.needs_log_file = self.log_debug or self.log_error
         self.on_error = on_error
         self.verbose_mode = verbose
         self.progress = start
         self.message = init_message
         self.progress_length = 100
+        self.subtask_length = None
+
+        # Render throttling: DETAIL updates only redraw the interface once per integer percentage
+        # point of progress, or once per _render_min_interval seconds, whichever comes first.
+        self._last_render_ts = 0.0
+        self._last_render_pct = -1
+        self._render_min_interval = 0.05
+
+        # Background rendering. The lock guards reporter state and the interface, which are shared
+        # between the caller and the renderer thread; the dirty event signals pending changes.
+        self._render_lock = threading.RLock()
+        self._dirty = threading.Event()
+        self._stopping = threading.Event()
+        self._renderer = None
+
+        # Shared DETAIL progress counter for workers (see advance). The renderer thread polls it and
+        # applies any change since it was last seen, so workers never wait on the reporter itself.
+        # Created on first use, since most reporters never need it.
+        self._counter = None
+        self._counter_seen = 0
+
+        # Update handlers, indexed by [verbose_mode][update_type]. DEBUG updates have no handler, as
+        # they are only displayed in debug mode.
+        handlers = [None] * (max(ProgressUpdateType) + 1)
+        verbose_handlers = handlers.copy()
+        handlers[ProgressUpdateType.MAJOR] = self._handle_major
+        handlers[ProgressUpdateType.MINOR] = self._handle_minor
+        handlers[ProgressUpdateType.DETAIL] = self._handle_detail
+        verbose_handlers[ProgressUpdateType.MAJOR] = self._handle_major_verbose
+        verbose_handlers[ProgressUpdateType.MINOR] = self._handle_minor_verbose
+        verbose_handlers[ProgressUpdateType.DETAIL] = self._handle_detail
+        self._handlers = (handlers, verbose_handlers)
+
         self.setup()
 
     def setup(self, **args):
@@ -103,51 +144,20 @@ class AbstractProgressReporter(ABC):
                 If debug mode is enabled, debug message will display if provided, else message. This
                 provides a way to provide more verbose output for debug mode.
         """
-        if self.debug_mode:
-            # If debug mode is on, skip the progress bars and just print the message.
-            return self._handle_debug(debug_message or message, update_type)
-        elif update_type is not ProgressUpdateType.DEBUG:
-            if update_type is ProgressUpdateType.MAJOR:
-                if self.verbose_mode:
-                    # If verbose, print the message. Progress bars will be generated by minor updates.
-                    self._print_message(message)
-                else:
-                    # If not verbose, create a progress bar that will span the entire operation.
-                    self.subtask_length = None
-                    self.message = message
-                    self.progress_length = length
-                    self._new_progress_bar(length, message, progress)
-            elif update_type is ProgressUpdateType.MINOR:
-                if self.verbose_mode:
-                    # If verbose, create a progress bar for this suboperation.
-                    self.progress_length = length
-                    self.message = message
-                    self._new_progress_bar(length, before_message=message)
-                else:
-                    # If not verbose, update the major progress bar progress and label.
-                    self.subtask_length = length
-                    if progress:
-                        self.set_progress(progress)
-                    if message:
-                        self.message = message
-                        self.set_message(message)
-                    self._update_interface()
-            elif update_type is ProgressUpdateType.DETAIL:
-                # Update progress. If verbose, also update the progress bar label.
-                if hasattr(self, "subtask_length") and self.subtask_length:
-                    weighted_progress = (progress / self.subtask_length)
-                else:
-                    weighted_progress = progress
-
-                if progress:
-                    self.set_progress(weighted_progress)
-                if message and self.verbose_mode:
-                    self.message = message
-                    self.set_message(message)
-                self._update_interface()
+        # The lock keeps the background renderer from redrawing while state is being changed.
+        with self._render_lock:
+            # Skip updates that wouldn't display, log or change anything.
+            if not self.__should_update(update_type, progress, message): return
 
-        if self.log_debug:
-            self.__log_debug(debug_message or message)
+            if self.debug_mode:
+                # If debug mode is on, skip the progress bars and just print the message.
+                return self._handle_debug(debug_message or message, update_type)
+
+            handler = self._handlers[bool(self.verbose_mode)][update_type]
+            if handler: handler(progress, message, length)
+
+            if self.log_debug:
+                self.__log_debug(debug_message or message)
 
     def major(self, message: str = None, length: int = 100, debug_message: str = None) -> None:
         """
@@ -204,6 +214,44 @@ class AbstractProgressReporter(ABC):
         """
         return self.update(ProgressUpdateType.DEBUG, debug_message=message)
 
+    def advance(self, amount: int = 1) -> None:
+        """
+        Adds to the progress of the current task. Safe to call from worker threads.
+
+        Unlike detail, this only increments a shared counter, without waiting on the reporter or
+        interface. The renderer thread applies it to the progress bar on its next pass. If
+        background_render is off, it's applied and rendered immediately instead.
+
+        Parameters:
+            amount: int, optional
+                The amount of progress to add.
+        """
+        counter = self.__get_counter()
+        if self.background_render and self._renderer is None:
+            with self._render_lock:
+                self.__start_renderer()
+
+        with counter.get_lock():
+            counter.value += amount
+
+        if not self.background_render:
+            with self._render_lock:
+                if self.__apply_counter(): self._render()
+
+    @property
+    def progress_counter(self) -> multiprocessing.Value:
+        """
+        The shared counter behind advance, which can be passed to worker processes.
+
+        Workers should increment it while holding its lock (i.e. with counter.get_lock()). Accessing it
+        starts the renderer thread (if background_render is on), so that changes are picked up.
+        """
+        counter = self.__get_counter()
+        if self.background_render:
+            with self._render_lock:
+                self.__start_renderer()
+        return counter
+
     def report_error(self, error: Exception, context: dict = {}) -> str:
         """
         Concrete wrapper for getting a user response to an error.
@@ -222,7 +270,10 @@ class AbstractProgressReporter(ABC):
         elif self.on_error in ["a", "abort"]:
             response = "abort"
         else:
-            response = self._get_error_response(error, context)
+            with self._render_lock:
+                # Draw pending progress first, so it isn't drawn below the prompt.
+                self.__flush_render()
+                response = self._get_error_response(error, context)
 
         if self.log_error:
             self.__log_error(error, context)
@@ -260,8 +311,11 @@ class AbstractProgressReporter(ABC):
             fatal: bool, optional
                 If True, end the current progress bar and print the message as deeply red as possible.
         """
-        self._close_progress_bar()
-        self._print_message(message, error=True, fatal_error=fatal)
+        with self._render_lock:
+            # Draw pending progress before closing the bar, so it isn't drawn after the message.
+            self.__flush_render()
+            self._close_progress_bar()
+            self._print_message(message, error=True, fatal_error=fatal)
 
     def set_progress(self, progress: int) -> None:
         """
@@ -283,15 +337,62 @@ class AbstractProgressReporter(ABC):
         """
         self.message = message
 
-    @abstractmethod
     def clean_up(self) -> None:
         """
         Cleans up any progress bars for a clean exit.
+
+        Stops the background renderer, if running, and closes the log file. Subclasses should call
+        super().clean_up() before doing a final render and closing the interface.
         """
-        pass
+        self._stop_renderer()
+        self.__close_log()
 
     # Protected methods
 
+    def _handle_major_verbose(self, progress: int, message: str, length: int) -> None:
+        """Handles a MAJOR update in verbose mode."""
+        # Print the message. Progress bars will be generated by minor updates.
+        self.__flush_render()
+        self._print_message(message)
+
+    def _handle_major(self, progress: int, message: str, length: int) -> None:
+        """Handles a MAJOR update in non-verbose mode."""
+        # Create a progress bar that will span the entire operation.
+        self.__flush_render()
+        self.subtask_length = None
+        self.message = message
+        self.progress_length = length
+        self._new_progress_bar(length, message, progress)
+
+    def _handle_minor_verbose(self, progress: int, message: str, length: int) -> None:
+        """Handles a MINOR update in verbose mode."""
+        # Create a progress bar for this suboperation.
+        self.__flush_render()
+        self.progress_length = length
+        self.message = message
+        self._new_progress_bar(length, before_message=message)
+
+    def _handle_minor(self, progress: int, message: str, length: int) -> None:
+        """Handles a MINOR update in non-verbose mode."""
+        # Update the major progress bar progress and label.
+        self.subtask_length = length
+        if progress:
+            self.set_progress(progress)
+        if message:
+            self.message = message
+            self.set_message(message)
+        self._render(force=True)
+
+    def _handle_detail(self, progress: int, message: str, length: int) -> None:
+        """Handles a DETAIL update."""
+        # Update progress. If verbose, also update the progress bar label.
+        if progress:
+            self.set_progress(self.__weighted_progress(progress))
+        if message and self.verbose_mode:
+            self.message = message
+            self.set_message(message)
+        self._render()
+
     @abstractmethod
     def _update_interface(self, **args) -> None:
         """
@@ -306,6 +407,47 @@ class AbstractProgressReporter(ABC):
         """
         pass
 
+    def _render(self, force: bool = False) -> None:
+        """
+        Updates the interface, throttled so that bursts of small updates don't redraw on every call.
+
+        Forced renders are drawn immediately. Otherwise, if background_render is set, the render is
+        deferred to the renderer thread, which draws the latest state at most once per
+        _render_min_interval seconds. If not, the interface is redrawn if the integer percentage of
+        progress has changed, or if at least _render_min_interval seconds have passed since the last redraw.
+
+        Parameters:
+            force: bool, optional
+                If True, always update the interface (i.e. for MAJOR/MINOR transitions or clean up).
+        """
+        if force:
+            return self.__render_now()
+
+        if self.background_render:
+            # Just flag that there is something to draw; the renderer thread picks up the latest state.
+            self.__start_renderer()
+            self._dirty.set()
+            return
+
+        pct = int(self.progress * 100 / max(self.progress_length, 1))
+        if pct != self._last_render_pct or time.monotonic() - self._last_render_ts >= self._render_min_interval:
+            self._last_render_pct = pct
+            self.__render_now()
+
+    def _stop_renderer(self) -> None:
+        """
+        Stops the background renderer thread, if running, and waits for it to exit.
+        """
+        if self._renderer is None: return
+
+        self._stopping.set()
+        self._dirty.set()
+        self._renderer.join()
+        self._renderer = None
+
+        # Pick up anything counted since the renderer's last pass.
+        self.__apply_counter()
+
     @abstractmethod
     def _new_progress_bar(self, length: int, before_message: str = None, bar_init_message: str = None,
                           start: int = 0) -> None:
@@ -347,9 +489,9 @@ class AbstractProgressReporter(ABC):
             message: str
                 The message to be printed.
         """
-        if self.debug_mode and message:
-            debug_text = f"{self._now()} -- {message}"
-            self._print_message(debug_text)
+        if not self.debug_mode or not message: return
+
+        self._print_message(self._now() + " -- " + message)
 
     def __log_debug(self, message) -> None:
         """
@@ -372,7 +514,7 @@ class AbstractProgressReporter(ABC):
         """
         if self.log_error:
             error_info = self.__error_info(error)
-            message = str(error_info) + "\n" + str(PrettyPrinter(indent=2).pprint(context))
+            message = f"{error_info}\n{pformat(context, indent=2)}"
             self.__write_to_log(message)
 
     def __write_to_log(self, message) -> None:
@@ -383,10 +525,22 @@ class AbstractProgressReporter(ABC):
             message: str
                 The message to be written
         """
-        if self.log_file and message:
-            text = f"{self._now()} -- {message}"
-            with open(self.log_file, "a") as log:
-                log.write(text + "\n")
+        if not self.log_file or not message: return
+
+        # The log file is set after initialization (and could change), so open it on first write.
+        # It's line-buffered, so each line is still written out even if clean_up is never reached.
+        if self._log_fp is None or self._log_fp.name != str(self.log_file):
+            self.__close_log()
+            self._log_fp = open(self.log_file, "a", buffering=1)
+
+        self._log_fp.write("".join((self._now(), " -- ", message, "\n")))
+
+    def __close_log(self) -> None:
+        """Closes the log file, if open."""
+        if self._log_fp is None: return
+
+        self._log_fp.close()
+        self._log_fp = None
 
     @abstractmethod
     def _print_message(self, message: str, **kwargs) -> None:
@@ -403,18 +557,89 @@ class AbstractProgressReporter(ABC):
 
     def _now(self) -> str:
         """Returns the current timestamp in ISO format."""
-        return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        # The timestamp has 1-second resolution, so only re-format it when the second changes.
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second)))
+        return self._ts_cache[1]
 
     # Private methods
 
-    def __should_update(self, update_type: ProgressUpdateType) -> bool:
-        """Should the reporter update the interface for a given update type?"""
-        if update_type is ProgressUpdateType.MAJOR:
+    def __should_update(self, update_type: ProgressUpdateType, progress: int = None, message: str = None) -> bool:
+        """Would an update with the given type, progress and message display, log or change anything?"""
+        if update_type is ProgressUpdateType.DEBUG:
+            return self.debug_mode or self.log_debug
+        elif self.debug_mode or self.log_debug:
             return True
-        elif update_type is ProgressUpdateType.MINOR:
-            return self.verbose
-        elif update_type is ProgressUpdateType.DEBUG:
-            return self.debug
+        elif update_type is ProgressUpdateType.DETAIL:
+            # DETAIL updates only change progress and, if verbose, the message.
+            progress_changed = bool(progress) and self.__weighted_progress(progress) != self.progress
+            message_changed = bool(message) and self.verbose_mode and message != self.message
+            return progress_changed or message_changed
+        return True
+
+    def __weighted_progress(self, progress: int) -> float:
+        """Scales DETAIL progress to the current subtask, if there is one."""
+        return progress / self.subtask_length if self.subtask_length else progress
+
+    def __flush_render(self) -> None:
+        """Draws any progress still pending on the current bar, before it is replaced or printed under."""
+        self._dirty.clear()
+        self._render(force=True)
+
+    def __render_now(self) -> None:
+        """Updates the interface immediately."""
+        with self._render_lock:
+            self._last_render_ts = time.monotonic()
+            self._update_interface()
+
+    def __start_renderer(self) -> None:
+        """Starts the background renderer thread, if it isn't already running."""
+        if self._renderer is not None: return
+
+        self._stopping.clear()
+        self._renderer = threading.Thread(target=self.__run_renderer, name="progress-renderer", daemon=True)
+        self._renderer.start()
+
+    def __run_renderer(self) -> None:
+        """Renderer thread loop: draws the latest state whenever it changes, then waits out the interval."""
+        while not self._stopping.is_set():
+            dirty = self._dirty.wait(timeout=self._render_min_interval)
+            if self._stopping.is_set(): break
+
+            if self.__apply_counter(): dirty = True
+            if not dirty: continue
+
+            self._dirty.clear()
+            self.__render_now()
+            self._stopping.wait(self._render_min_interval)
+
+    def __apply_counter(self) -> bool:
+        """
+        Applies any change in the shared progress counter to the current progress, weighted by the
+        subtask length in the same way as DETAIL updates.
+
+        Returns: bool
+            True if progress changed.
+        """
+        if self._counter is None: return False
+
+        # Read the value under the lock, so a caller holding a stale value can't move progress backwards.
+        with self._render_lock:
+            value = self._counter.value
+            if value == self._counter_seen: return False
+
+            delta = value - self._counter_seen
+            self._counter_seen = value
+            self.set_progress(self.progress + (delta / self.subtask_length if self.subtask_length else delta))
+        return True
+
+    def __get_counter(self) -> multiprocessing.Value:
+        """Returns the shared progress counter, creating it on first use."""
+        if self._counter is None:
+            with self._render_lock:
+                if self._counter is None: self._counter = multiprocessing.Value("q", 0)
+        return self._counter
 
     def __error_info(self, error: Exception) -> str:
         if isinstance(error, ServerResponseError):
@@ -9,7 +9,7 @@ to end and create new progress bars.
 import textwrap
 import traceback
 
-from pprint import PrettyPrinter
+from pprint import pformat
 
 from journal_transporter.progress.abstract_progress_reporter import AbstractProgressReporter
 from journal_transporter.progress.progress_update_type import ProgressUpdateType
@@ -21,25 +21,29 @@ class CliProgressReporter(AbstractProgressReporter):
 
     def setup(self) -> None:
         self.progressbar = None
+        self.progress_diff = 0
 
     def set_progress(self, new_total_progress: int) -> None:
         # Typer/Click takes progress updates as an amount to be added to current progress,
         # not a total value. Before updating progress in order to maintain a total, first
         # find the difference between old and new progress and save the value to be used in #_update_interface.
-        self.progress_diff = new_total_progress - self.progress
+        # Differences accumulate until the interface is next updated, since renders may be throttled.
+        self.progress_diff += new_total_progress - self.progress
         super().set_progress(new_total_progress)
 
     def clean_up(self) -> None:
+        super().clean_up()
+        # Flush any progress held back by render throttling before closing the bar.
+        if self.progressbar: self._render(force=True)
         self._close_progress_bar()
 
     # Protected
 
     def _update_interface(self) -> None:
-        if not hasattr(self, "progressbar"): return
+        if not self.progressbar: return
 
         self.progressbar.label = self.message
-        progress_diff = self.progress_diff if hasattr(self, "progress_diff") else 0
-        self.progressbar.update(progress_diff)
+        self.progressbar.update(self.progress_diff)
 
         # Zero out progress_diff in case this gets called again before set_progress.
         self.progress_diff = 0
@@ -72,9 +76,14 @@ class CliProgressReporter(AbstractProgressReporter):
     def _close_progress_bar(self) -> None:
         # Simulate a block __exit__
         # See https://github.com/pallets/click/blob/d14ee193d01096113d5de0428b8552bcd5f368e9/src/click/_termui_impl.py#L101 # noqa
-        if hasattr(self, "progressbar"): self.progressbar.render_finish()
+        # Drop the closed bar, so later renders don't draw it again.
+        if self.progressbar:
+            self.progressbar.render_finish()
+            self.progressbar = None
 
     def _handle_debug(self, message: str, update_type: ProgressUpdateType = ProgressUpdateType.DEBUG) -> None:
+        if not message: return
+
         if update_type is ProgressUpdateType.MAJOR:
             theme = "highlight"
         elif update_type is ProgressUpdateType.MINOR:
@@ -84,7 +93,7 @@ class CliProgressReporter(AbstractProgressReporter):
         elif update_type is ProgressUpdateType.DEBUG:
             theme = "info"
 
-        if message: self._print_message(f"{self._now()} -- {message}", theme)
+        self._print_message(self._now() + " -- " + message, theme)
 
     def _print_message(self, message: str, theme: str = None, error: bool = False,
                        fatal_error: bool = False, **kwargs) -> None:
@@ -117,7 +126,7 @@ class CliProgressReporter(AbstractProgressReporter):
             return "abort"
         elif choice in ["i", "info"]:
             cli.write(self.__error_info(error), line_break=True)
-            if len(context): cli.write(PrettyPrinter(indent=2).pprint(context), line_break=True)
+            if len(context): cli.write(pformat(context, indent=2), line_break=True)
             self._get_error_response(error, context)
         elif choice in ["t", "traceback"]:
             cli.write(traceback.format_exc())
@@ -3,8 +3,8 @@ from journal_transporter.progress.abstract_progress_reporter import AbstractProg
 
 class NullProgressReporter(AbstractProgressReporter):
 
-    def clean_up(self) -> None:
-        pass
+    # There's nothing to draw, so don't spin up a renderer thread.
+    background_render = False
 
     def _update_interface(self) -> None:
         pass
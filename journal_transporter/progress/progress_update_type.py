@@ -1,10 +1,10 @@
 """Types of progress updates"""
 # journal_transporter/progress/progress_update_type.py
 
-from enum import Enum
+from enum import IntEnum
 
 
-class ProgressUpdateType(Enum):
+class ProgressUpdateType(IntEnum):
     # MAJOR updates create a new progress bar. Typically, there should be one MAJOR update
     # per high-level operation (i.e. index, fetch, push).
     MAJOR = 1
@@ -50,3 +50,7 @@ class AbstractConnection(ABC):
     def setup(self):
         """Optionally performs any necessary setup to establish or validate the connection."""
         pass
+
+    def close(self):
+        """Optionally releases any resources held by the connection."""
+        pass
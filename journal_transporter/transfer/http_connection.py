@@ -3,13 +3,53 @@
 import json
 import requests
 
-from typing import Union
+from typing import Iterable, Iterator, Union
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from requests.utils import guess_filename
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util import Retry
 
 from journal_transporter.transfer.abstract_connection import AbstractConnection
 
+# orjson is considerably faster than the json module for large records. It's in the Pipfile, but
+# json is still used where it isn't installed.
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        return orjson.dumps(data).decode("utf-8")
+except ImportError:
+    _dumps = json.dumps
+
 
 class HTTPConnection(AbstractConnection):
 
+    # Connection pool sizing for the session's adapters
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 32
+
+    # Maximum number of concurrent requests when POSTing a list. Never more than the pool can hold.
+    MAX_WORKERS = 8
+
+    def setup(self) -> None:
+        # Credentials don't change over the life of the connection, so build the auth tuple once.
+        self._auth = (self.username, self.password) if self.username is not None else None
+
+        # Request kwargs shared by every request. Copied, then extended, for each request.
+        self._base_opts = {"auth": self._auth} if self._auth else {}
+
+        # Reuse one session for all requests, so connections to the host are pooled and kept alive
+        # rather than re-established (with a new TLS handshake) for every request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE,
+                              max_retries=self.__retry_policy())
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Set batch_post on the server definition if its API accepts {"records": [...]} bodies.
+        self.batch_post = str(self.options.get("batch_post")).lower() in ["true", "1", "yes"]
+
     def get(self, path: str, is_absolute: bool = False, **params) -> Union[list, dict]:
         """
         Submits a GET request to the connection.
@@ -27,68 +67,125 @@ class HTTPConnection(AbstractConnection):
         """
         url = path if is_absolute else f"{self.host.strip('/')}/{path.strip('/')}"
         request_opts = self.__build_get_params(params)
-        response = requests.get(url, **request_opts)
+        response = self._session.get(url, **request_opts)
         return response
 
-    def post(self, path: str, data) -> dict:
+    def post(self, path: str, data, batch_size: int = 50) -> dict:
         """
         Submits a POST request to the connection.
 
+        If data is a list, each record is POSTed separately. If the server supports batching (see
+        batch_post) and no record has files attached, records are instead sent in groups of
+        batch_size, as {"records": [...]}. Either way, requests are sent concurrently, and the
+        responses are returned in the same order as the input. TransferHandler._do_push only ever
+        passes a dict, so lists are currently only POSTed by library callers.
+
         Parameters:
             path: str
                 The path to be appended to the server's "host" value
             data: Any
                 Any serializable content to be submitted as POST data.
+            batch_size: int, optional
+                Maximum number of records per request, when batching.
 
         Returns: Any
-            The response content.
+            The response content. For lists, a list of responses (one per record, or one per batch).
         """
         url = f"{self.host.strip('/')}/{path.strip('/')}/"
-        request_opts = self.__build_post_params(data.copy())
 
-        response = None
         if type(data) is list:
-            response = []
-            for index, record in enumerate(data):
-                response.append(requests.post(url, **request_opts))
-        else:
-            response = requests.post(url, **request_opts)
+            if self.batch_post and not any("files" in record for record in data):
+                payloads = [{"records": data[i:i + batch_size]} for i in range(0, len(data), batch_size)]
+            else:
+                payloads = data
 
-        return response
+            return self.__post_concurrently(url, payloads)
+
+        return self._session.post(url, **self.__build_post_params(data))
+
+    def iter_post(self, path: str, records: Iterable) -> Iterator:
+        """
+        Submits a POST request per record, yielding each response as it is received.
+
+        Records are consumed lazily, so any iterable (i.e. a generator reading records from disk) can
+        be passed without materializing it, and each request and response can be garbage collected
+        once the caller moves on to the next.
+
+        Parameters:
+            path: str
+                The path to be appended to the server's "host" value
+            records: Iterable
+                Serializable records to be submitted as POST data, one request each.
+
+        Returns: Iterator
+            The responses, in the same order as the records.
+        """
+        url = f"{self.host.strip('/')}/{path.strip('/')}/"
+        for record in records:
+            yield self._session.post(url, **self.__build_post_params(record))
+
+    def close(self) -> None:
+        """Closes the session and any pooled connections."""
+        self._session.close()
 
     # Private
 
-    def __build_get_params(self, params: dict = None) -> dict:
-        ret = {
-            **self.__credentials(),
-            "params": params
-        }
+    def __post_concurrently(self, url: str, payloads: list) -> list:
+        """
+        POSTs each payload to the same URL, using a bounded thread pool.
 
-        return {k: v for (k, v) in ret.items() if v is not None}
+        Request params are built in the worker, just before sending, so that multipart bodies for
+        every payload aren't all held at once.
 
-    def __build_post_params(self, params: dict = None) -> dict:
-        files = params.get("files") if "files" in params else None
-        data_key = "data" if files else "json"
+        Parameters:
+            url: str
+                The full URL to POST to.
+            payloads: list
+                POST data for each request.
 
-        data = {}
-        for key, value in params.items():
-            if not key == "files":
-                data[key] = value
+        Returns: list
+            The responses, in the same order as payloads.
+        """
+        def post(payload):
+            return self._session.post(url, **self.__build_post_params(payload))
 
-        ret = {
-            **self.__credentials(),
-            "files": files,
-            data_key: {"json": json.dumps(data)} if files else data
-        }
+        if len(payloads) < 2:
+            return [post(payload) for payload in payloads]
 
-        return {k: v for (k, v) in ret.items() if v is not None}
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, self.POOL_MAXSIZE, len(payloads))) as executor:
+            return list(executor.map(post, payloads))
 
-    def __credentials(self) -> dict:
+    def __retry_policy(self) -> Retry:
         """
-        Builds credentials kwargs, if username is defined.
+        Retries connection errors and gateway errors with backoff. urllib3 only retries idempotent
+        methods on read/status errors, so POSTs aren't resent once the server has received them.
+        Exhausted retries return the last response, rather than raising, so that error handling is unchanged.
 
-        Returns: dict
-            The auth dict to possibly be included in the request.
+        Returns: Retry
+            The retry policy for the session's adapters.
         """
-        if self.username is None: return {}
-        return {"auth": (self.username, self.password)}
+        return Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504], raise_on_status=False)
+
+    def __build_get_params(self, params: dict = None) -> dict:
+        opts = self._base_opts.copy()
+        if params: opts["params"] = params
+        return opts
+
+    def __build_post_params(self, params: dict = None) -> dict:
+        files = params.get("files")
+        data = params
+        if "files" in params:
+            data = params.copy()
+            del data["files"]
+
+        if not files:
+            return {**self._base_opts, "json": data}
+
+        # Stream multipart bodies, so files are read from disk as the upload proceeds rather than
+        # the whole body being built in memory before sending.
+        fields = {"json": _dumps(data)}
+        for name, file in files.items():
+            fields[name] = file if isinstance(file, tuple) else (guess_filename(file) or name, file)
+
+        encoder = MultipartEncoder(fields=fields)
+        return {**self._base_opts, "data": encoder, "headers": {"Content-Type": encoder.content_type}}
@@ -240,7 +240,9 @@ class TransferHandler:
         self.progress.log_file = file_path
 
     def finalize(self) -> None:
-        pass
+        """Closes source and target connections."""
+        for connection in [self.source_connection, self.target_connection]:
+            if connection is not None: connection.close()
 
     # Meta file management
 
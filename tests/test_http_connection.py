@@ -0,0 +1,163 @@
+# transfer/tests/test_http_connection.py
+
+# All tests should only write files to the test/tmp directory,
+# which will be cleaned up automatically at the end of each test.
+
+import importlib
+import json
+import orjson
+import pytest
+import requests
+import sys
+import time
+
+from pathlib import Path
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+
+from journal_transporter.transfer import http_connection
+from journal_transporter.transfer.http_connection import HTTPConnection
+from journal_transporter.transfer.transfer_handler import TransferHandler
+
+# Constants
+
+HOST = "https://example.com"
+PATH = "journals"
+URL = f"{HOST}/{PATH}/"
+
+FILE_PATH = Path("tests/fixtures/journals/1/articles/1/files/1-1.pdf")
+
+RECORDS = [{"source_record_key": f"journal:{i}", "title": f"Journal {i}"} for i in range(5)]
+
+
+# Helpers
+
+
+def build_connection(**opts):
+    return HTTPConnection(**{"host": HOST, "username": "user", "password": "password", **opts})
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    """Replaces Session.post, recording the URL and kwargs for each call"""
+    calls = []
+
+    def mock_post(_session, url, **kwargs):
+        calls.append((url, kwargs))
+        return kwargs.get("json")
+
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    return calls
+
+
+# Tests
+
+
+def test_post(posts):
+    response = build_connection().post(PATH, RECORDS[0])
+
+    assert response == RECORDS[0]
+    assert posts == [(URL, {"auth": ("user", "password"), "json": RECORDS[0]})]
+
+
+def test_post_list(posts):
+    responses = build_connection().post(PATH, RECORDS)
+
+    # One request per record, each with that record's own data
+    assert responses == RECORDS
+    assert len(posts) == len(RECORDS)
+    assert sorted([kwargs["json"]["source_record_key"] for (_url, kwargs) in posts]) == \
+        [record["source_record_key"] for record in RECORDS]
+
+
+def test_post_list_batched(posts):
+    responses = build_connection(batch_post="True").post(PATH, RECORDS, batch_size=2)
+
+    assert responses == [{"records": RECORDS[0:2]}, {"records": RECORDS[2:4]}, {"records": RECORDS[4:]}]
+    assert len(posts) == 3
+    assert all(url == URL for (url, _kwargs) in posts)
+
+
+def test_post_list_order(monkeypatch):
+    received = []
+
+    def mock_post(_session, url, **kwargs):
+        # Finish requests out of order: later records respond first
+        index = int(kwargs["json"]["source_record_key"].split(":")[-1])
+        time.sleep((len(RECORDS) - index) * 0.02)
+        received.append(index)
+        return kwargs["json"]
+
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    responses = build_connection().post(PATH, RECORDS)
+
+    assert received != sorted(received)
+    assert responses == RECORDS
+
+
+def test_iter_post(posts):
+    consumed = []
+
+    def records():
+        for record in RECORDS:
+            consumed.append(record)
+            yield record
+
+    responses = build_connection().iter_post(PATH, records())
+
+    # Nothing is consumed or sent until the caller asks for a response
+    assert consumed == [] and posts == []
+    assert next(responses) == RECORDS[0]
+    assert len(consumed) == 1 and len(posts) == 1
+
+    assert list(responses) == RECORDS[1:]
+    assert [kwargs["json"] for (_url, kwargs) in posts] == RECORDS
+
+
+def test_post_files(posts):
+    with open(FILE_PATH, "rb") as file:
+        build_connection().post(PATH, {**RECORDS[0], "files": {"1-1.pdf_file": file}})
+
+        assert len(posts) == 1
+        url, kwargs = posts[0]
+        encoder = kwargs["data"]
+
+        # The record goes in a "json" field, followed by a part per file, named like requests' files=
+        assert isinstance(encoder, MultipartEncoder)
+        assert list(encoder.fields) == ["json", "1-1.pdf_file"]
+        assert json.loads(encoder.fields["json"]) == RECORDS[0]
+        assert encoder.fields["1-1.pdf_file"] == ("1-1.pdf", file)
+        assert kwargs["headers"] == {"Content-Type": encoder.content_type}
+        assert encoder.content_type.startswith("multipart/form-data; boundary=")
+        assert kwargs["auth"] == ("user", "password")
+        assert "json" not in kwargs and "files" not in kwargs
+
+
+def test_dumps():
+    record = {**RECORDS[0], "title": "Revista Año 1", "volume": 1.5, "issues": [1, None]}
+
+    assert http_connection._dumps(record) == orjson.dumps(record).decode("utf-8")
+    assert json.loads(http_connection._dumps(record)) == record
+
+
+def test_dumps_without_orjson(monkeypatch):
+    # A None entry in sys.modules makes the import raise ImportError
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    try:
+        importlib.reload(http_connection)
+        assert http_connection._dumps is json.dumps
+    finally:
+        monkeypatch.undo()
+        importlib.reload(http_connection)
+
+
+def test_finalize_closes_connections(monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda session: closed.append(session))
+
+    # Skip __init__, which prepares the data directory
+    handler = TransferHandler.__new__(TransferHandler)
+    handler.source_connection = build_connection()
+    handler.target_connection = build_connection()
+    handler.finalize()
+
+    assert closed == [handler.source_connection._session, handler.target_connection._session]
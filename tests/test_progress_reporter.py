@@ -3,9 +3,13 @@
 # All tests should only write files to the test/tmp directory,
 # which will be cleaned up automatically at the end of each test.
 
+import threading
+
 from journal_transporter import cli
 from journal_transporter.progress.cli_progress_reporter import CliProgressReporter
 
+from tests.shared import TMP_PATH
+
 # Constants
 
 INIT_MESSAGE = "Init Message"
@@ -118,3 +122,170 @@ def test_debug(monkeypatch, progress=build_progress_reporter(debug=True)):
     assert progress.message != MAJOR_MESSAGE
     assert progress.progress_length != MAJOR_LENGTH
     assert debug == MAJOR_MESSAGE
+
+
+def test_detail_render_throttle(monkeypatch, progress=build_progress_reporter()):
+    test_major(progress)
+    renders = []
+    monkeypatch.setattr(progress, "_update_interface", lambda: renders.append(progress.progress))
+    progress.background_render = False
+    progress._render_min_interval = 60
+
+    for i in range(1, 101):
+        progress.detail(i / 100, DETAIL_UNWEIGHTED_MESSAGE)
+
+    # MAJOR_LENGTH is 10, so 100 updates in hundredths only render at 0%, 1%, ..., 10%
+    assert len(renders) == 11
+    assert progress.progress == 1
+
+    progress.clean_up()
+    assert len(renders) == 12
+
+
+def test_detail_background_render(monkeypatch, progress=build_progress_reporter()):
+    test_major(progress)
+    renders = []
+    monkeypatch.setattr(progress, "_update_interface", lambda: renders.append(progress.progress))
+
+    for i in range(1, 101):
+        progress.detail(i / 100, DETAIL_UNWEIGHTED_MESSAGE)
+
+    progress.clean_up()
+
+    # Updates are coalesced by the renderer thread, and clean up always draws the final state
+    assert len(renders) < 100
+    assert renders[-1] == 1
+    assert progress._renderer is None
+
+
+def test_debug_log(progress=build_progress_reporter(log="d")):
+    TMP_PATH.mkdir(exist_ok=True)
+    log_file = TMP_PATH / "log.txt"
+    log_file.write_text("")
+    progress.log_file = log_file
+
+    progress.debug(MAJOR_MESSAGE)
+    progress.debug(MINOR_MESSAGE)
+    progress.clean_up()
+
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[0].endswith(f" -- {MAJOR_MESSAGE}")
+    assert lines[1].endswith(f" -- {MINOR_MESSAGE}")
+
+
+def test_error_log(progress=build_progress_reporter(log="e", on_error="c")):
+    TMP_PATH.mkdir(exist_ok=True)
+    log_file = TMP_PATH / "error_log.txt"
+    log_file.write_text("")
+    progress.log_file = log_file
+
+    response = progress.report_error(Exception(MAJOR_MESSAGE), {"url": "https://example.com"})
+    progress.clean_up()
+
+    assert response == "continue"
+    content = log_file.read_text()
+    assert MAJOR_MESSAGE in content
+    assert "'url': 'https://example.com'" in content
+    assert "None" not in content
+
+
+def test_advance(progress=build_progress_reporter()):
+    test_major(progress)
+
+    workers = [threading.Thread(target=lambda: [progress.advance() for _ in range(2)]) for _ in range(4)]
+    for worker in workers: worker.start()
+    for worker in workers: worker.join()
+
+    progress.clean_up()
+
+    assert progress.progress == 8
+
+
+def test_detail_unchanged(monkeypatch, progress=build_progress_reporter()):
+    test_major(progress)
+    renders = []
+    monkeypatch.setattr(progress, "_render", lambda force=False: renders.append(force))
+
+    progress.detail(DETAIL_PROGRESS)
+    progress.detail(DETAIL_PROGRESS)
+    # Not verbose, so the message wouldn't be displayed either
+    progress.detail(DETAIL_PROGRESS, DETAIL_UNWEIGHTED_MESSAGE)
+
+    assert len(renders) == 1
+    assert progress.progress == DETAIL_PROGRESS
+
+
+def test_minor_verbose_flushes_bar(progress=build_progress_reporter(verbose=True)):
+    test_major_verbose(progress)
+    progress.minor(0, MINOR_MESSAGE, 4)
+    old_bar = progress.progressbar
+
+    for i in range(1, 5):
+        progress.detail(i, DETAIL_UNWEIGHTED_MESSAGE)
+    progress.minor(1, MINOR_MESSAGE, MINOR_LENGTH)
+    progress.clean_up()
+
+    # Progress still waiting on the renderer is drawn before the bar is replaced
+    assert progress.progressbar is not old_bar
+    assert old_bar.pos == 4
+    assert old_bar.label == DETAIL_UNWEIGHTED_MESSAGE
+
+
+def fill_verbose_bar(progress):
+    progress.major(MAJOR_MESSAGE, MAJOR_LENGTH)
+    progress.minor(0, MINOR_MESSAGE, 4)
+    for i in range(1, 5):
+        progress.detail(i, f"Item {i}")
+
+
+def test_major_verbose_flushes_bar(capsys, progress=build_progress_reporter(verbose=True)):
+    fill_verbose_bar(progress)
+    progress.major("Next Major Message", MAJOR_LENGTH)
+    progress.clean_up()
+
+    # Output isn't a TTY, so the bar only writes its label as it changes
+    out = capsys.readouterr().out
+    assert out.index("Item 4") < out.index("Next Major Message")
+
+
+def test_error_flushes_bar(capsys, progress=build_progress_reporter(verbose=True)):
+    fill_verbose_bar(progress)
+    progress.error("Error Message")
+    progress.clean_up()
+
+    # The closed bar isn't drawn again after the message
+    out = capsys.readouterr().out
+    assert out.rindex("Item 4") < out.index("Error Message")
+
+
+def test_report_error_flushes_bar(capsys, monkeypatch, progress=build_progress_reporter(verbose=True)):
+    monkeypatch.setattr(progress, "_get_error_response", lambda error, context: print("Prompt") or "continue")
+    fill_verbose_bar(progress)
+
+    response = progress.report_error(Exception(MAJOR_MESSAGE))
+    progress.clean_up()
+
+    out = capsys.readouterr().out
+    assert response == "continue"
+    assert out.index("Item 4") < out.index("Prompt")
+
+
+def test_advance_foreground(progress=build_progress_reporter()):
+    test_major(progress)
+    progress.background_render = False
+
+    progress.advance(DETAIL_PROGRESS)
+
+    assert progress.progress == DETAIL_PROGRESS
+    assert progress.progressbar.pos == DETAIL_PROGRESS
+    progress.clean_up()
+
+
+def test_counter_is_lazy(progress=build_progress_reporter()):
+    assert progress._counter is None
+
+    progress.progress_counter
+    progress.clean_up()
+
+    assert progress._counter is not None
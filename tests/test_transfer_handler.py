@@ -89,11 +89,11 @@ def handler():
     return TransferHandler(TMP_PATH, source=server(), target=server())
 
 
-def mock_get(path, *args, **kwargs):
+def mock_get(_session, path, *args, **kwargs):
     return MockGetResponse(path)
 
 
-def mock_post(path, *args, **kwargs):
+def mock_post(_session, path, *args, **kwargs):
     return MockPostResponse(path, **kwargs)
 
 
@@ -146,7 +146,7 @@ def test_setup(handler):
 
 
 def test_index(monkeypatch, handler):
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     structure = handler.STRUCTURE
 
@@ -157,13 +157,13 @@ def test_index(monkeypatch, handler):
 
 
 def test_fetch_gate(monkeypatch, handler):
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     with pytest.raises(AssertionError):
         handler.fetch_data([])
 
 
 def test_fetch(monkeypatch, handler):
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
 
     structure = handler.STRUCTURE
 
@@ -175,14 +175,14 @@ def test_fetch(monkeypatch, handler):
 
 
 def test_push_gate(monkeypatch, handler):
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
     with pytest.raises(AssertionError):
         handler.push_data([])
 
 
 def test_push(monkeypatch, handler):
-    monkeypatch.setattr(requests, "get", mock_get)
-    monkeypatch.setattr(requests, "post", mock_post)
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
 
     handler.fetch_indexes([])
     handler.fetch_data([])